@@ -2,18 +2,62 @@
 from __future__ import annotations
 
 import argparse
-from datetime import datetime
+import errno
+from contextlib import nullcontext
+from functools import lru_cache
 import gzip
 import os
 from pathlib import Path
+import re
 import shutil
 import subprocess
 import sys
+import time
+from types import MappingProxyType
+from typing import BinaryIO, Final, Mapping, NamedTuple
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+DEFAULTS: Final[Mapping[str, str]] = MappingProxyType(
+    {
+        "r1_5p": "TGAGTTCCACGACACCGTCA",
+        "r2_5p": "CTAATACGACTCCGAATTCC",
+        "r1_3p": "GGAATTCGGAGTCGTATTAG",
+        "r2_3p": "TGACGGTGTCGTGGAACTCA",
+    }
+)
+
+
+class Adapters(NamedTuple):
+    r1_5p: str
+    r2_5p: str
+    r1_3p: str
+    r2_3p: str
+
+
+FASTQ_CHUNK_SIZE = 1 << 20
+FASTQ_WINDOW_SIZE = 1 << 22
+
+# Same output as fastq_to_fasta: CRLF dropped, header cut to its ID, and a
+# nonzero exit on a truncated final record (including trailing blank lines).
+AWK_FQ2FA = (
+    r'{sub(/\r$/,"")} NR%4==1{sub(/^@/,"");print ">" $1} NR%4==2{print} '
+    "END{if (NR%4) exit 1}"
+)
 
-DEFAULT_ADAPTER_5P_R1 = "TGAGTTCCACGACACCGTCA"
-DEFAULT_ADAPTER_5P_R2 = "CTAATACGACTCCGAATTCC"
-DEFAULT_ADAPTER_3P_R1 = "GGAATTCGGAGTCGTATTAG"
-DEFAULT_ADAPTER_3P_R2 = "TGACGGTGTCGTGGAACTCA"
+# errno/winerror values that pathlib.Path.exists() treats as "does not exist".
+_MISSING_ERRNOS = (errno.ENOENT, errno.ENOTDIR, errno.EBADF, errno.ELOOP)
+_MISSING_WINERRORS = (21, 123, 1921)
+
+INVALID_RUN_ID_CHARS = '<>:"/\\|?*'
+_INVALID_RUN_ID_RE = re.compile(f"[{re.escape(INVALID_RUN_ID_CHARS)}]")
+
+_PREFIX_RE = re.compile(
+    r"^(?P<stem>.+?)(?P<marker>_R1_001|_R1|-R1|\.R1)?(?:\.fastq\.gz|\.fq\.gz|\.fastq|\.fq)?$"
+)
 
 MODE_LABELS = {
     "merge-only": "withoutTrim",
@@ -116,22 +160,22 @@ def parse_args() -> argparse.Namespace:
     )
     parser.add_argument(
         "--adapter-5p-r1",
-        default=DEFAULT_ADAPTER_5P_R1,
+        default=DEFAULTS["r1_5p"],
         help="R1 5' adapter sequence (without '^').",
     )
     parser.add_argument(
         "--adapter-5p-r2",
-        default=DEFAULT_ADAPTER_5P_R2,
+        default=DEFAULTS["r2_5p"],
         help="R2 5' adapter sequence (without '^').",
     )
     parser.add_argument(
         "--adapter-3p-r1",
-        default=DEFAULT_ADAPTER_3P_R1,
+        default=DEFAULTS["r1_3p"],
         help="R1 3' adapter sequence (without '$').",
     )
     parser.add_argument(
         "--adapter-3p-r2",
-        default=DEFAULT_ADAPTER_3P_R2,
+        default=DEFAULTS["r2_3p"],
         help="R2 3' adapter sequence (without '$').",
     )
     parser.add_argument(
@@ -149,6 +193,11 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Emit assemble-fail FASTQ files.",
     )
+    parser.add_argument(
+        "--emit-fasta",
+        action="store_true",
+        help="Also write a FASTA copy of the merged FASTQ (the FASTQ is the canonical output).",
+    )
     parser.add_argument(
         "--swap-r1r2",
         action="store_true",
@@ -163,14 +212,12 @@ def parse_args() -> argparse.Namespace:
 
 
 def infer_prefix(r1_path: Path) -> str:
-    name = r1_path.name
-    for suffix in [".fastq.gz", ".fq.gz", ".fastq", ".fq"]:
-        if name.endswith(suffix):
-            name = name[: -len(suffix)]
-            break
-    for marker in ["_R1_001", "_R1", "-R1", ".R1"]:
-        if name.endswith(marker):
-            return name[: -len(marker)]
+    m = _PREFIX_RE.match(r1_path.name)
+    if m is None:
+        return r1_path.stem
+    name = m.group("stem")
+    if m.group("marker"):
+        return name
     if "_R1_" in name:
         return name.split("_R1_")[0]
     return name
@@ -181,9 +228,8 @@ def mode_label(mode: str) -> str:
 
 
 def validate_run_id(run_id: str) -> None:
-    invalid = '<>:"/\\|?*'
-    if any(ch in invalid for ch in run_id):
-        raise ValueError(f"--run-id contains invalid characters: {invalid}")
+    if _INVALID_RUN_ID_RE.search(run_id):
+        raise ValueError(f"--run-id contains invalid characters: {INVALID_RUN_ID_CHARS}")
 
 
 def sanitize_adapter(seq: str) -> str:
@@ -192,19 +238,18 @@ def sanitize_adapter(seq: str) -> str:
 
 
 def ensure_prefix(seq: str, prefix: str) -> str:
-    seq = seq.strip()
     if seq.startswith(prefix):
         return seq
     return f"{prefix}{seq}"
 
 
 def ensure_suffix(seq: str, suffix: str) -> str:
-    seq = seq.strip()
     if seq.endswith(suffix):
         return seq
     return f"{seq}{suffix}"
 
 
+@lru_cache(maxsize=1)
 def resolve_assemblepairs_path(explicit: str | None = None) -> Path:
     if explicit:
         path = Path(explicit)
@@ -227,66 +272,183 @@ def resolve_assemblepairs_path(explicit: str | None = None) -> Path:
     )
 
 
-def resolve_cutadapt_cmd() -> list[str]:
+@lru_cache(maxsize=1)
+def resolve_cutadapt_cmd() -> tuple[str, ...]:
     found = shutil.which("cutadapt")
     if found:
-        return [found]
-    return [sys.executable, "-m", "cutadapt"]
+        return (found,)
+    # The cutadapt entry point of the running environment may not be on PATH.
+    env_dir = Path(sys.executable).parent
+    # Windows venvs put python.exe in Scripts\ itself; conda keeps it one level up.
+    candidates = (
+        env_dir / "cutadapt",
+        env_dir / "cutadapt.exe",
+        env_dir / "Scripts" / "cutadapt.exe",
+    )
+    for candidate in candidates:
+        if candidate.exists():
+            return (str(candidate),)
+    return (sys.executable, "-m", "cutadapt")
+
+
+def child_env() -> dict[str, str]:
+    """Environment for child tools; lets Python children reuse cached bytecode."""
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    return env
+
 
+def resolve_fq2fa_cmd(in_path: str) -> list[str] | None:
+    """Return an awk FASTQ->FASTA command writing to stdout, if awk is available."""
+    found = shutil.which("awk")
+    if found and not in_path.endswith(".gz"):
+        return [found, AWK_FQ2FA, in_path]
+    return None
 
-def run_command(cmd: list[str], dry_run: bool, cwd: Path | None = None) -> None:
+
+def run_command(
+    cmd: list[str],
+    dry_run: bool,
+    cwd: str | None = None,
+    stdout_path: str | None = None,
+) -> None:
     cmd_str = subprocess.list2cmdline(cmd)
+    if stdout_path is not None:
+        cmd_str += f" > {stdout_path}"
     print(f">> {cmd_str}")
     if dry_run:
         return
-    subprocess.run(cmd, check=True, cwd=str(cwd) if cwd else None)
-
-
-def fastq_to_fasta(in_path: Path, out_path: Path) -> None:
-    opener = gzip.open if in_path.suffix == ".gz" else open
-    with opener(in_path, "rt", encoding="utf-8", errors="replace") as fin:
-        with open(out_path, "w", encoding="utf-8") as fout:
-            while True:
-                header = fin.readline()
-                if not header:
-                    break
-                seq = fin.readline()
-                plus = fin.readline()
-                qual = fin.readline()
-                if not qual:
-                    raise ValueError("Truncated FASTQ record detected.")
-                header = header.strip()
-                if header.startswith("@"):
-                    header = header[1:]
-                header = header.split()[0]
-                fout.write(f">{header}\n")
-                fout.write(seq.strip() + "\n")
+    if stdout_path is None:
+        subprocess.run(cmd, check=True, cwd=cwd, env=child_env())
+        return
+    with open(stdout_path, "wb") as fout:
+        subprocess.run(cmd, check=True, cwd=cwd, stdout=fout, env=child_env())
+
+
+def _convert_fastq_block(buf: bytes) -> tuple[bytes, bytes]:
+    """Convert the complete records in buf; return (fasta, unconsumed tail)."""
+    if b"\r" in buf:
+        buf = buf.replace(b"\r\n", b"\n")
+    # split() finds every newline in C; the last item is the unterminated rest.
+    lines = buf.split(b"\n")
+    n = (len(lines) - 1) // 4 * 4
+    tail = b"\n".join(lines[n:])
+    if not n:
+        return b"", tail
+    fasta = [b""] * (n // 2)
+    fasta[0::2] = [
+        b">" + (header[1:] if header[:1] == b"@" else header).split(None, 1)[0]
+        for header in lines[0:n:4]
+    ]
+    fasta[1::2] = lines[1:n:4]
+    fasta.append(b"")
+    return b"\n".join(fasta), tail
+
+
+def open_fastq_binary(in_path: str) -> BinaryIO:
+    if not in_path.endswith(".gz"):
+        return open(in_path, "rb", buffering=FASTQ_CHUNK_SIZE)
+    return gzip.open(in_path, "rb")
+
+
+def enlarge_pipe(pipe: BinaryIO) -> None:
+    """Grow a Linux pipe buffer so streamed FASTQ crosses it in 1 MB chunks."""
+    if fcntl is None or not hasattr(fcntl, "F_SETPIPE_SZ"):
+        return
+    try:
+        fcntl.fcntl(pipe.fileno(), fcntl.F_SETPIPE_SZ, FASTQ_CHUNK_SIZE)
+    except OSError:
+        pass  # above /proc/sys/fs/pipe-max-size; keep the default
+
+
+def fastq_stream_to_fasta(fin: BinaryIO, out_path: str, tee_path: str | None = None) -> None:
+    tee_cm = open(tee_path, "wb", buffering=FASTQ_CHUNK_SIZE) if tee_path else nullcontext()
+    with open(out_path, "wb", buffering=FASTQ_CHUNK_SIZE) as fout, tee_cm as tee:
+        tail = b""
+        while True:
+            chunk = fin.read(FASTQ_WINDOW_SIZE)
+            if not chunk:
+                break
+            if tee is not None:
+                tee.write(chunk)
+            fasta, tail = _convert_fastq_block(tail + chunk if tail else chunk)
+            fout.write(fasta)
+        # Leftover blank lines are an incomplete record too, as in the awk path.
+        if tail:
+            if not tail.endswith(b"\n"):
+                tail += b"\n"
+            fasta, tail = _convert_fastq_block(tail)
+            if tail:
+                raise ValueError("Truncated FASTQ record detected.")
+            fout.write(fasta)
+
+
+def fastq_to_fasta(in_path: str, out_path: str) -> None:
+    with open_fastq_binary(in_path) as fin:
+        fastq_stream_to_fasta(fin, out_path)
+
+
+def write_fasta(in_path: str, out_path: str, dry_run: bool) -> None:
+    fq2fa_cmd = resolve_fq2fa_cmd(in_path)
+    if dry_run:
+        if fq2fa_cmd is not None:
+            run_command(fq2fa_cmd, dry_run=True, stdout_path=out_path)
+        else:
+            print(f">> fastq_to_fasta {in_path} -> {out_path}")
+        return
+    try:
+        if fq2fa_cmd is not None:
+            run_command(fq2fa_cmd, dry_run=False, stdout_path=out_path)
+        else:
+            fastq_to_fasta(in_path, out_path)
+    except (subprocess.CalledProcessError, ValueError):
+        # Do not leave a partial FASTA behind.
+        if os.path.exists(out_path):
+            os.remove(out_path)
+        raise
+
+
+def stream_command_to_fasta(
+    cmd: list[str], fastq_path: str, fasta_path: str, dry_run: bool
+) -> None:
+    """Run cmd with FASTQ on stdout, saving the FASTQ and its FASTA in one pass."""
+    cmd_str = subprocess.list2cmdline(cmd)
+    print(f">> {cmd_str} | tee {fastq_path} | fastq_to_fasta -> {fasta_path}")
+    if dry_run:
+        return
+    with subprocess.Popen(
+        cmd, stdout=subprocess.PIPE, bufsize=FASTQ_CHUNK_SIZE, env=child_env()
+    ) as proc:
+        enlarge_pipe(proc.stdout)
+        fastq_stream_to_fasta(proc.stdout, fasta_path, tee_path=fastq_path)
+    if proc.returncode != 0:
+        raise subprocess.CalledProcessError(proc.returncode, cmd)
 
 
 def run_cutadapt_paired(
-    r1: Path,
-    r2: Path,
-    out_r1: Path,
-    out_r2: Path,
-    adapters: dict[str, str],
+    r1: str,
+    r2: str,
+    out_r1: str,
+    out_r2: str,
+    adapters: Adapters,
     threads: int,
     error_rate: float,
     overlap: int,
     min_length: int,
     dry_run: bool,
 ) -> None:
-    cmd = resolve_cutadapt_cmd()
+    cmd = list(resolve_cutadapt_cmd())
     cmd += [
         "-j",
         str(threads),
         "-g",
-        ensure_prefix(adapters["r1_5p"], "^"),
+        adapters.r1_5p,
         "-G",
-        ensure_prefix(adapters["r2_5p"], "^"),
+        adapters.r2_5p,
         "-a",
-        ensure_suffix(adapters["r1_3p"], "$"),
+        adapters.r1_3p,
         "-A",
-        ensure_suffix(adapters["r2_3p"], "$"),
+        adapters.r2_3p,
         "-e",
         str(error_rate),
         "-O",
@@ -294,59 +456,63 @@ def run_cutadapt_paired(
         "--minimum-length",
         str(min_length),
         "-o",
-        str(out_r1),
+        out_r1,
         "-p",
-        str(out_r2),
-        str(r1),
-        str(r2),
+        out_r2,
+        r1,
+        r2,
     ]
     run_command(cmd, dry_run=dry_run)
 
 
 def run_cutadapt_single(
-    in_fastq: Path,
-    out_fastq: Path,
-    adapters: dict[str, str],
+    in_fastq: str,
+    out_fastq: str,
+    adapters: Adapters,
     threads: int,
     error_rate: float,
     overlap: int,
     min_length: int,
     dry_run: bool,
+    fasta_out: str | None = None,
 ) -> None:
-    cmd = resolve_cutadapt_cmd()
+    cmd = list(resolve_cutadapt_cmd())
     cmd += [
         "--times",
         "2",
         "-j",
         str(threads),
         "-g",
-        ensure_prefix(adapters["r1_5p"], "^"),
+        adapters.r1_5p,
         "-g",
-        ensure_prefix(adapters["r2_5p"], "^"),
+        adapters.r2_5p,
         "-a",
-        ensure_suffix(adapters["r1_3p"], "$"),
+        adapters.r1_3p,
         "-a",
-        ensure_suffix(adapters["r2_3p"], "$"),
+        adapters.r2_3p,
         "-e",
         str(error_rate),
         "-O",
         str(overlap),
         "--minimum-length",
         str(min_length),
-        "-o",
-        str(out_fastq),
-        str(in_fastq),
     ]
+    if fasta_out is not None:
+        # cutadapt writes to stdout without -o; convert to FASTA on the fly.
+        cmd.append(in_fastq)
+        stream_command_to_fasta(cmd, out_fastq, fasta_out, dry_run=dry_run)
+        return
+    cmd += ["-o", out_fastq, in_fastq]
     run_command(cmd, dry_run=dry_run)
 
 
 def run_assemblepairs(
-    r1: Path,
-    r2: Path,
+    r1: str,
+    r2: str,
     outname: str,
     coord: str,
     rc: str,
-    log_path: Path,
+    log_path: str,
     failed: bool,
     swap_r1r2: bool,
     assemble_alpha: float,
@@ -355,7 +521,7 @@ def run_assemblepairs(
     assemble_maxlen: int,
     assemble_scanrev: bool,
     dry_run: bool,
-    outdir: Path,
+    outdir: str,
 ) -> None:
     assemble_path = resolve_assemblepairs_path()
     first = r1 if swap_r1r2 else r2
@@ -365,9 +531,9 @@ def run_assemblepairs(
         str(assemble_path),
         "align",
         "-1",
-        str(first),
+        first,
         "-2",
-        str(second),
+        second,
         "--coord",
         coord,
         "--rc",
@@ -383,7 +549,7 @@ def run_assemblepairs(
         "--outname",
         outname,
         "--log",
-        str(log_path),
+        log_path,
     ]
     if failed:
         cmd.append("--failed")
@@ -396,56 +562,70 @@ def main() -> int:
     args = parse_args()
     r1 = Path(args.r1)
     r2 = Path(args.r2)
-    if not r1.exists():
-        print(f"R1 not found: {r1}", file=sys.stderr)
-        return 2
-    if not r2.exists():
-        print(f"R2 not found: {r2}", file=sys.stderr)
-        return 2
+    for label, path in (("R1", r1), ("R2", r2)):
+        try:
+            os.stat(path)
+        except OSError as exc:
+            if (
+                exc.errno not in _MISSING_ERRNOS
+                and getattr(exc, "winerror", None) not in _MISSING_WINERRORS
+            ):
+                raise
+            print(f"{label} not found: {path}", file=sys.stderr)
+            return 2
 
     base_outdir = Path(args.outdir) if args.outdir else r1.parent
     base_outdir.mkdir(parents=True, exist_ok=True)
 
     prefix_base = args.prefix or infer_prefix(r1)
-    run_id = args.run_id.strip() if args.run_id else datetime.now().strftime("%Y%m%d_%H%M%S")
+    run_id = args.run_id.strip() if args.run_id else time.strftime("%Y%m%d_%H%M%S")
     validate_run_id(run_id)
     run_name = f"{prefix_base}_{mode_label(args.mode)}_{run_id}"
     run_dir = base_outdir / run_name
     run_dir.mkdir(parents=True, exist_ok=True)
+    run_dir_str = str(run_dir)
 
-    assemble_prefix_arg = args.assemble_prefix or f"{run_name}_presto"
-    assemble_prefix_path = Path(assemble_prefix_arg)
-    if assemble_prefix_path.is_absolute():
-        assemble_outname = assemble_prefix_path
-    else:
-        assemble_outname = run_dir / assemble_prefix_arg
-    assemble_outname.parent.mkdir(parents=True, exist_ok=True)
+    # Internal paths stay plain strings; they are only handed to subprocesses.
+    assemble_outname = os.path.join(run_dir_str, args.assemble_prefix or f"{run_name}_presto")
+    os.makedirs(os.path.dirname(assemble_outname), exist_ok=True)
 
     if args.log:
-        log_path = Path(args.log)
-        if not log_path.is_absolute():
-            log_path = run_dir / log_path
+        log_path = os.path.join(run_dir_str, args.log)
     else:
-        log_path = run_dir / f"{run_name}_AP_align.log"
-
-    adapters = {
-        "r1_5p": sanitize_adapter(args.adapter_5p_r1),
-        "r2_5p": sanitize_adapter(args.adapter_5p_r2),
-        "r1_3p": sanitize_adapter(args.adapter_3p_r1),
-        "r2_3p": sanitize_adapter(args.adapter_3p_r2),
-    }
+        log_path = os.path.join(run_dir_str, f"{run_name}_AP_align.log")
+
+    adapters = Adapters(
+        *(
+            sanitize_adapter(raw)
+            for raw in (
+                args.adapter_5p_r1,
+                args.adapter_5p_r2,
+                args.adapter_3p_r1,
+                args.adapter_3p_r2,
+            )
+        )
+    )
+    # Anchor once here; the cutadapt builders use these strings as-is.
+    anchored_adapters = Adapters(
+        r1_5p=ensure_prefix(adapters.r1_5p, "^"),
+        r2_5p=ensure_prefix(adapters.r2_5p, "^"),
+        r1_3p=ensure_suffix(adapters.r1_3p, "$"),
+        r2_3p=ensure_suffix(adapters.r2_3p, "$"),
+    )
 
-    trimmed_r1 = run_dir / f"{run_name}_trim_R1.fastq"
-    trimmed_r2 = run_dir / f"{run_name}_trim_R2.fastq"
-    merge_then_trim_fastq = run_dir / f"{run_name}.fastq"
+    trimmed_r1 = os.path.join(run_dir_str, f"{run_name}_trim_R1.fastq")
+    trimmed_r2 = os.path.join(run_dir_str, f"{run_name}_trim_R2.fastq")
+    merge_then_trim_fastq = os.path.join(run_dir_str, f"{run_name}.fastq")
 
     if args.mode == "trim-merge":
+        # AssemblePairs counts and indexes -1/-2 as separate seekable files,
+        # so the trimmed pair has to be written to disk rather than piped.
         run_cutadapt_paired(
-            r1=r1,
-            r2=r2,
+            r1=str(r1),
+            r2=str(r2),
             out_r1=trimmed_r1,
             out_r2=trimmed_r2,
-            adapters=adapters,
+            adapters=anchored_adapters,
             threads=args.threads,
             error_rate=args.cutadapt_error_rate,
             overlap=args.cutadapt_overlap,
@@ -455,13 +635,13 @@ def main() -> int:
         assemble_r1 = trimmed_r1
         assemble_r2 = trimmed_r2
     else:
-        assemble_r1 = r1
-        assemble_r2 = r2
+        assemble_r1 = str(r1)
+        assemble_r2 = str(r2)
 
     run_assemblepairs(
         r1=assemble_r1,
         r2=assemble_r2,
-        outname=str(assemble_outname),
+        outname=assemble_outname,
         coord=args.coord,
         rc=args.rc,
         log_path=log_path,
@@ -473,41 +653,38 @@ def main() -> int:
         assemble_maxlen=args.assemble_maxlen,
         assemble_scanrev=args.assemble_scanrev,
         dry_run=args.dry_run,
-        outdir=run_dir,
+        outdir=run_dir_str,
     )
 
-    assemble_pass = assemble_outname.parent / f"{assemble_outname.name}_assemble-pass.fastq"
-    if not args.dry_run and not assemble_pass.exists():
+    assemble_pass = f"{assemble_outname}_assemble-pass.fastq"
+    if not args.dry_run and not os.path.exists(assemble_pass):
         print(f"AssemblePairs output not found: {assemble_pass}", file=sys.stderr)
         return 3
+    fasta_source = merge_then_trim_fastq if args.mode == "merge-trim" else assemble_pass
+    fasta_out = os.path.splitext(fasta_source)[0] + ".fasta" if args.emit_fasta else None
     if args.mode == "merge-trim":
         run_cutadapt_single(
             in_fastq=assemble_pass,
             out_fastq=merge_then_trim_fastq,
-            adapters=adapters,
+            adapters=anchored_adapters,
             threads=args.threads,
             error_rate=args.cutadapt_error_rate,
             overlap=args.cutadapt_overlap,
             min_length=args.cutadapt_min_length,
             dry_run=args.dry_run,
+            fasta_out=fasta_out,
         )
-        if not args.dry_run and not merge_then_trim_fastq.exists():
+        if not args.dry_run and not os.path.exists(merge_then_trim_fastq):
             print(f"merge-then-trim output not found: {merge_then_trim_fastq}", file=sys.stderr)
             return 4
-        fasta_source = merge_then_trim_fastq
-    else:
-        fasta_source = assemble_pass
-
-    fasta_out = fasta_source.with_suffix(".fasta")
-    if args.dry_run:
-        print(f">> fastq_to_fasta {fasta_source} -> {fasta_out}")
-    else:
-        fastq_to_fasta(fasta_source, fasta_out)
+    elif fasta_out is not None:
+        write_fasta(fasta_source, fasta_out, dry_run=args.dry_run)
 
     print("Done.")
     print(f"output folder: {run_dir}")
     print(f"merged fastq: {fasta_source}")
-    print(f"fasta: {fasta_out}")
+    if fasta_out is not None:
+        print(f"fasta: {fasta_out}")
     print(f"log: {log_path}")
     return 0
 
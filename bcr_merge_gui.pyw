@@ -178,6 +178,7 @@ class App(tk.Tk):
         self.var_adapt_3p_r1 = tk.StringVar(value=DEFAULT_ADAPTER_3P_R1)
         self.var_adapt_3p_r2 = tk.StringVar(value=DEFAULT_ADAPTER_3P_R2)
         self.var_failed = tk.BooleanVar(value=False)
+        self.var_emit_fasta = tk.BooleanVar(value=True)
         self.var_dry_run = tk.BooleanVar(value=False)
         self.var_swap_r1r2 = tk.BooleanVar(value=False)
         self.var_assemble_alpha = tk.StringVar(value="1e-5")
@@ -350,6 +351,9 @@ class App(tk.Tk):
         ttk.Checkbutton(
             flags_frame, text="Swap R1/R2 for AssemblePairs", variable=self.var_swap_r1r2
         ).grid(row=0, column=2, sticky="w", padx=5)
+        ttk.Checkbutton(flags_frame, text="Emit FASTA", variable=self.var_emit_fasta).grid(
+            row=0, column=3, sticky="w", padx=5
+        )
         row += 1
 
         btn_frame = ttk.Frame(frame)
@@ -523,6 +527,8 @@ class App(tk.Tk):
             cmd.append("--dry-run")
         if self.var_swap_r1r2.get():
             cmd.append("--swap-r1r2")
+        if self.var_emit_fasta.get():
+            cmd.append("--emit-fasta")
 
         if self.var_use_conda.get():
             conda_exe = self.var_conda_exe.get().strip()